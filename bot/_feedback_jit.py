@@ -0,0 +1,118 @@
+"""
+Numba-compiled kernels for the Wordle bot.
+
+Importing this module raises ImportError when Numba is not installed; the bot
+then falls back to its pure NumPy implementations.
+"""
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+NUM_PATTERNS = 3**5
+
+
+def best_guess(pattern, cand_idx, poss_idx, bound):
+    """
+    Find the candidate guess leaving the fewest expected remaining words.
+
+    pattern is the (guesses, targets) uint8 pattern matrix; cand_idx selects
+    the guess rows to consider, most promising first, and poss_idx the
+    still-possible target columns. Returns (position in cand_idx, score) of
+    the first best candidate scoring strictly below bound, or (-1, bound).
+    Equal scores are broken by the smaller largest bucket.
+
+    A candidate's sum of squared bucket sizes only grows as targets are
+    added, so it is abandoned as soon as it exceeds the best score so far.
+    """
+    chunks = max(1, min(len(cand_idx), 4 * get_num_threads()))
+    return _best_guess(pattern, cand_idx, poss_idx, bound, chunks)
+
+
+@njit(parallel=True, cache=True)
+def _best_guess(pattern, cand_idx, poss_idx, bound, chunks):
+    total = poss_idx.shape[0]
+    n = cand_idx.shape[0]
+    chunk_limit = np.empty(chunks, dtype=np.float64)
+    chunk_largest = np.empty(chunks, dtype=np.int64)
+    chunk_pos = np.empty(chunks, dtype=np.int64)
+    for k in prange(chunks):
+        # Stride through the candidates so every chunk sees promising ones early.
+        limit = bound * total
+        # No bucket is empty, so nothing ties the bound itself.
+        largest_limit = 0
+        pos = -1
+        counts = np.zeros(NUM_PATTERNS, dtype=np.int64)
+        for c in range(k, n, chunks):
+            row = pattern[cand_idx[c]]
+            counts[:] = 0
+            squares = 0
+            largest = 0
+            for p in range(total):
+                code = row[poss_idx[p]]
+                squares += 2 * counts[code] + 1
+                counts[code] += 1
+                largest = max(largest, counts[code])
+                if squares > limit:
+                    break
+            if squares < limit or (squares == limit and largest < largest_limit):
+                limit = squares
+                largest_limit = largest
+                pos = c
+        chunk_limit[k] = limit
+        chunk_largest[k] = largest_limit
+        chunk_pos[k] = pos
+
+    best_limit = bound * total
+    best_largest = 0
+    best_pos = -1
+    for k in range(chunks):
+        if chunk_pos[k] < 0:
+            continue
+        if (
+            best_pos < 0
+            or chunk_limit[k] < best_limit
+            or (
+                chunk_limit[k] == best_limit
+                and (
+                    chunk_largest[k] < best_largest
+                    or (chunk_largest[k] == best_largest and chunk_pos[k] < best_pos)
+                )
+            )
+        ):
+            best_limit = chunk_limit[k]
+            best_largest = chunk_largest[k]
+            best_pos = chunk_pos[k]
+    return best_pos, best_limit / total
+
+
+@njit(parallel=True, cache=True)
+def build_pattern_matrix(guesses, targets):
+    """
+    Compute the feedback pattern code of every guess against every target.
+
+    guesses and targets are (N, 5) uint8 letter arrays with A=0..Z=25.
+    Returns a (len(guesses), len(targets)) uint8 matrix.
+    """
+    out = np.empty((guesses.shape[0], targets.shape[0]), dtype=np.uint8)
+    for g in prange(guesses.shape[0]):
+        counts = np.zeros(26, dtype=np.int8)
+        for t in range(targets.shape[0]):
+            # Greens first; count the target letters they leave unmatched.
+            counts[:] = 0
+            green = 0
+            for i in range(5):
+                if guesses[g, i] == targets[t, i]:
+                    green |= 1 << i
+                else:
+                    counts[targets[t, i]] += 1
+            code = 0
+            for i in range(5):
+                digit = 0
+                if green & (1 << i):
+                    digit = 2
+                elif counts[guesses[g, i]] > 0:
+                    counts[guesses[g, i]] -= 1
+                    digit = 1
+                code = code * 3 + digit
+            out[g, t] = code
+    return out
@@ -6,13 +6,19 @@ This bot uses entropy-based decision making to choose guesses that maximize
 information gain, minimizing the expected number of remaining possible words.
 """
 
-import math
+import contextlib
+import functools
+import hashlib
+import io
+import multiprocessing
 import sys
 import os
 import threading
 import time
 from collections import Counter
-from typing import List, Set, Tuple, Dict, Optional
+from typing import BinaryIO, Callable, List, Tuple, Dict, Optional
+
+import numpy as np
 
 # Add parent directory to path to import wordle_game
 _parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -20,33 +26,255 @@ sys.path.insert(0, _parent_dir)
 
 from game.wordle_game import WordleGame, Color
 
+try:
+    from bot import _feedback_jit
+except ImportError:
+    _feedback_jit = None
+
 # Get file paths
 _GAME_DIR = os.path.join(_parent_dir, "game")
 _DICTIONARY_DIR = os.path.join(_parent_dir, "dictionary")
 WORDLE_LA_FILE = os.path.join(_DICTIONARY_DIR, "wordle-La.txt")
 WORDLE_TA_FILE = os.path.join(_DICTIONARY_DIR, "wordle-Ta.txt")
+_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "wordle_bot",
+)
+# Bump when the pattern encoding changes so stale cache files are ignored.
+_PATTERN_CACHE_VERSION = 1
+# Bump when guess scoring changes so the cached opening guess is recomputed.
+_SCORING_VERSION = 2
+# Guesses made with this much feedback history or less are memoized.
+_OPENING_DEPTH = 1
+
+# Feedback patterns are packed as five base-3 digits (gray=0, yellow=1, green=2),
+# first letter most significant, giving codes 0..242.
+FeedbackCode = int
+NUM_PATTERNS = 3**5
+ALL_GREEN: FeedbackCode = NUM_PATTERNS - 1
+_DIGIT_COLORS = (Color.GRAY, Color.YELLOW, Color.GREEN)
+_FEEDBACK_DIGITS = str.maketrans({"X": "0", "Y": "1", "G": "2"})
+
+
+@functools.lru_cache(maxsize=2_000_000)
+def compute_feedback(guess: str, target: str) -> FeedbackCode:
+    """
+    Return the packed pattern code of an uppercase guess against a target.
+    Pure and memoized, so it is safe to share across threads and processes.
+    """
+    digits = [0] * 5
+    # Unmatched target letters, counted per letter A..Z.
+    remaining = [0] * 26
+
+    for i in range(5):
+        if guess[i] == target[i]:
+            digits[i] = 2
+        else:
+            remaining[ord(target[i]) - 65] += 1
+
+    for i in range(5):
+        if not digits[i]:
+            letter = ord(guess[i]) - 65
+            if remaining[letter]:
+                digits[i] = 1
+                remaining[letter] -= 1
+
+    code = 0
+    for digit in digits:
+        code = code * 3 + digit
+    return code
+
+
+def _code_digits(code: FeedbackCode) -> List[int]:
+    """Unpack a pattern code into its five color digits, first letter first."""
+    digits = [0] * 5
+    for i in range(4, -1, -1):
+        code, digits[i] = divmod(code, 3)
+    return digits
+
+
+def _encode_words(words: List[str]) -> np.ndarray:
+    """Encode uppercase 5-letter words as a (N, 5) uint8 array with A=0..Z=25."""
+    buf = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return buf.reshape(-1, 5) - ord("A")
+
+
+def _pack_words(codes: np.ndarray) -> np.ndarray:
+    """Pack (N, 5) letter codes into uint64 words, letter i in byte i."""
+    padded = np.zeros((len(codes), 8), dtype=np.uint8)
+    padded[:, :5] = codes
+    return padded.view("<u8").ravel()
+
+
+# SWAR constants: every byte, the high bit of the five letter bytes, and a
+# one in each letter byte (multiplying by it broadcasts or sums lanes).
+_LOW7 = np.uint64(0x7F7F7F7F7F7F7F7F)
+_LANE_HIGH = np.uint64(0x0000008080808080)
+_LANE_ONES = np.uint64(0x0000000101010101)
+_BYTE = np.uint64(0xFF)
+
+
+def _zero_lanes(x: np.ndarray) -> np.ndarray:
+    """Set the high bit of each letter byte of x that is zero (exact, no borrow)."""
+    return ~(((x & _LOW7) + _LOW7) | x | _LOW7) & _LANE_HIGH
+
+
+def _lane_count(flags: np.ndarray) -> np.ndarray:
+    """Count the lanes flagged by _zero_lanes."""
+    return ((flags >> np.uint64(7)) * _LANE_ONES) >> np.uint64(32) & _BYTE
+
+
+def _build_pattern_matrix(
+    guesses: np.ndarray, targets: np.ndarray, block: int = 512
+) -> np.ndarray:
+    """
+    Compute the feedback pattern code of every guess against every target.
+    Returns a (len(guesses), len(targets)) uint8 matrix.
+
+    Words are packed one per uint64, so each step compares all five letters
+    of every (guess, target) pair in a handful of bitwise operations.
+    """
+    packed_guesses = _pack_words(guesses)
+    packed_targets = _pack_words(targets)[None, :]
+    pattern = np.empty((len(guesses), len(targets)), dtype=np.uint8)
+    for start in range(0, len(guesses), block):
+        g = packed_guesses[start : start + block, None]
+        green = _zero_lanes(g ^ packed_targets)
+        yellow = np.zeros_like(green)
+        code = np.zeros(green.shape, dtype=np.uint8)
+        for i in range(5):
+            shift = np.uint64(8 * i)
+            lane = np.uint64(0x80) << shift
+            spread = ((g >> shift) & _BYTE) * _LANE_ONES
+            # Unmatched copies of this letter in the target, minus those
+            # already claimed by yellows earlier in the guess.
+            available = _lane_count(_zero_lanes(spread ^ packed_targets) & ~green)
+            if i:
+                earlier = _zero_lanes(spread ^ g) & yellow & (lane - np.uint64(1))
+                available = available - _lane_count(earlier)
+            is_green = (green & lane) != 0
+            is_yellow = ~is_green & (available.astype(np.int64) > 0)
+            yellow |= np.where(is_yellow, lane, np.uint64(0))
+            code = code * np.uint8(3) + is_green.astype(np.uint8) * np.uint8(2)
+            code += is_yellow
+        pattern[start : start + block] = code
+    return pattern
+
+
+def _compute_patterns(guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Build pattern codes with the Numba kernel if available, else with NumPy."""
+    if _feedback_jit is not None:
+        return _feedback_jit.build_pattern_matrix(guesses, targets)
+    return _build_pattern_matrix(guesses, targets)
+
+
+def _cache_key(guesses: List[str], targets: List[str]) -> str:
+    """Digest identifying cache files derived from these word lists."""
+    key = "\n".join([str(_PATTERN_CACHE_VERSION)] + guesses + [""] + targets)
+    return hashlib.sha1(key.encode("ascii")).hexdigest()
+
+
+def _save_cache_file(path: str, write: Callable[[BinaryIO], None]):
+    """Atomically write a cache file; failures are ignored."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is only an optimization; carry on without it.
+        pass
+
+
+def _load_pattern_matrix(
+    guesses: List[str], targets: List[str], cache_key: str
+) -> np.ndarray:
+    """
+    Load the pattern matrix for these word lists from the on-disk cache,
+    building and saving it on first use. The cached file is memory-mapped.
+    """
+    path = os.path.join(_CACHE_DIR, f"patterns_{cache_key}.npy")
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        pass
+
+    pattern = _compute_patterns(_encode_words(guesses), _encode_words(targets))
+    _save_cache_file(path, lambda f: np.save(f, pattern))
+    return pattern
+
+
+def _expected_remaining(
+    pattern: np.ndarray,
+    cand_idx: np.ndarray,
+    possible_idx: np.ndarray,
+    block: int = 64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expected remaining words, sum(bucket_size ** 2) / total, and the largest
+    bucket size for each candidate row of the pattern matrix restricted to
+    the possible columns.
+
+    Candidates are processed in blocks so each gathered slice and its
+    histograms stay cache-resident instead of materializing the full
+    (candidates, possible) slice.
+    """
+    total = len(possible_idx)
+    possible_idx = np.ascontiguousarray(possible_idx)
+    squares = np.empty(len(cand_idx), dtype=np.int64)
+    largest = np.empty(len(cand_idx), dtype=np.int64)
+    # Offset each row's codes so one bincount yields every row's histogram.
+    offsets = np.arange(block)[:, None] * NUM_PATTERNS
+    for start in range(0, len(cand_idx), block):
+        sub = pattern[cand_idx[start : start + block, None], possible_idx]
+        rows = len(sub)
+        counts = np.bincount(
+            (sub + offsets[:rows]).ravel(), minlength=rows * NUM_PATTERNS
+        )
+        counts = counts.reshape(rows, -1)
+        squares[start : start + rows] = (counts * counts).sum(axis=1)
+        largest[start : start + rows] = counts.max(axis=1)
+    return squares / total, largest
 
 
 class WordleBot:
     """Optimal Wordle bot using information theory."""
 
+    # The opening guess is the same for every game; shared by all instances.
+    _FIRST_GUESS: Optional[str] = None
+
     def __init__(self):
         """Initialize the bot with word lists."""
         self.la_words = self._load_word_list(WORDLE_LA_FILE)
         self.ta_words = self._load_word_list(WORDLE_TA_FILE)
-        self.all_words = [w.upper() for w in self.la_words + self.ta_words]
-        self.possible_words = set(self.la_words)
-        self._spinner_active = False
-        self._spinner_thread = None
-        self._game_helper = WordleGame()
+        self.all_words = list(
+            dict.fromkeys(w.upper() for w in self.la_words + self.ta_words)
+        )
+        self.la_idx = np.arange(len(self.la_words), dtype=np.uint32)
+        self._spinner_active = threading.Event()
+        self._spinner_idle = threading.Event()
+        self._spinner_idle.set()
+        self._spinner_thread: Optional[threading.Thread] = None
+        # la_words lead all_words, so a target's index is also its guess index.
+        self._guess_index = {w: i for i, w in enumerate(self.all_words)}
+        self._all_guess_idx = np.arange(len(self.all_words), dtype=np.uint32)
+        self._target_codes = _encode_words(self.la_words)
+        guess_codes = _encode_words(self.all_words)
+        self._letter_presence = np.zeros((len(self.all_words), 26), dtype=np.float32)
+        self._letter_presence[np.arange(len(self.all_words))[:, None], guess_codes] = 1
+        self._cache_key = _cache_key(self.all_words, self.la_words)
+        self.pattern_matrix = _load_pattern_matrix(
+            self.all_words, self.la_words, self._cache_key
+        )
+        self._opening_guesses: Dict[Tuple[FeedbackCode, ...], str] = {}
 
     @staticmethod
     def _load_word_list(filename: str) -> List[str]:
         """Load the word list from file."""
         try:
             with open(filename, "r") as f:
-                words = [line.strip().upper() for line in f if line.strip()]
-            return words
+                return f.read().upper().split()
         except FileNotFoundError:
             print(f"Error: {filename} not found!")
             sys.exit(1)
@@ -55,146 +283,213 @@ class WordleBot:
         """
         Generate feedback for a guess against a target.
         Returns a list of tuples: (letter, color)
-        Uses WordleGame's feedback method.
         """
-        original_target = self._game_helper.target
-        self._game_helper.target = target.upper()
-        feedback = self._game_helper._get_feedback(guess.upper())
-        self._game_helper.target = original_target
-        return feedback
+        guess = guess.upper()
+        digits = _code_digits(compute_feedback(guess, target.upper()))
+        return [(letter, _DIGIT_COLORS[d]) for letter, d in zip(guess, digits)]
+
+    @staticmethod
+    def _feedback_to_code(feedback: List[Tuple[str, Color]]) -> FeedbackCode:
+        """Pack a feedback list into its base-3 pattern code."""
+        code = 0
+        for _, color in feedback:
+            code = code * 3 + color
+        return code
+
+    @staticmethod
+    def _parse_feedback(feedback_str: str) -> FeedbackCode:
+        """Pack a validated G/Y/X feedback string into its pattern code."""
+        return int(feedback_str.translate(_FEEDBACK_DIGITS), 3)
+
+    def _pattern_row(self, guess: str) -> np.ndarray:
+        """Return the pattern codes of a guess against every target word."""
+        if guess in self._guess_index:
+            return self.pattern_matrix[self._guess_index[guess]]
+        return _compute_patterns(_encode_words([guess]), self._target_codes)[0]
 
     def _filter_words(
-        self, words: Set[str], guess: str, feedback: List[Tuple[str, Color]]
-    ) -> Set[str]:
-        """Filter possible words based on feedback from a guess."""
-        filtered = set()
-        for word in words:
-            if self._matches_feedback(word, guess, feedback):
-                filtered.add(word)
-        return filtered
-
-    def _matches_feedback(
-        self, word: str, guess: str, feedback: List[Tuple[str, Color]]
-    ) -> bool:
-        """Check if a word matches the given feedback pattern."""
-        expected_feedback = self._get_feedback(guess, word)
-        return expected_feedback == feedback
-
-    def _calculate_entropy(self, guess: str, possible_words: Set[str]) -> float:
+        self, possible_idx: np.ndarray, guess: str, code: FeedbackCode
+    ) -> np.ndarray:
+        """Keep the possible word indices whose pattern for guess equals code."""
+        return possible_idx[self._pattern_row(guess)[possible_idx] == code]
+
+    def _words(self, possible_idx: np.ndarray) -> List[str]:
+        """Convert target indices back to words."""
+        return [self.la_words[i] for i in possible_idx]
+
+    def _order_candidates(
+        self, cand_idx: np.ndarray, possible_idx: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate the entropy (information gain) of a guess.
-        Higher entropy means more information gained.
+        Sort candidate guesses most promising first: by how evenly their
+        distinct letters split the possible words. Guesses sharing no letter
+        with any possible word would be all gray and cannot split, so they
+        are dropped.
         """
-        if not possible_words:
-            return 0.0
-
-        feedback_counts: Dict[Tuple, int] = {}
-        for target in possible_words:
-            feedback = tuple(self._get_feedback(guess, target))
-            feedback_counts[feedback] = feedback_counts.get(feedback, 0) + 1
-
-        total = len(possible_words)
-        entropy = 0.0
-        for count in feedback_counts.values():
-            probability = count / total
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
-
-        return entropy
-
-    def _calculate_expected_remaining(
-        self, guess: str, possible_words: Set[str]
-    ) -> float:
+        present = self._letter_presence[possible_idx].sum(axis=0)
+        balance = np.minimum(present, len(possible_idx) - present)
+        letters = self._letter_presence[cand_idx]
+        splits = letters @ (present > 0).astype(np.float32) > 0
+        cand_idx = cand_idx[splits]
+        heuristic = letters[splits] @ balance
+        return cand_idx[np.argsort(-heuristic, kind="stable")]
+
+    def _best_candidate(
+        self, cand_idx: np.ndarray, possible_idx: np.ndarray, bound: float
+    ) -> Tuple[int, float]:
         """
-        Calculate the expected number of remaining words after a guess.
-        Lower is better.
+        Return (position in cand_idx, expected remaining) of the first
+        candidate with the lowest score strictly below bound, or (-1, bound).
+        Equal scores go to the candidate with the smaller largest bucket.
         """
-        if not possible_words:
-            return 0.0
-
-        feedback_counts: Dict[Tuple, int] = {}
-        for target in possible_words:
-            feedback = tuple(self._get_feedback(guess, target))
-            feedback_counts[feedback] = feedback_counts.get(feedback, 0) + 1
-
-        total = len(possible_words)
-        expected = 0.0
-        for count in feedback_counts.values():
-            probability = count / total
-            expected += probability * count
-
-        return expected
+        if not len(cand_idx):
+            return -1, bound
+        if _feedback_jit is not None:
+            pos, score = _feedback_jit.best_guess(
+                self.pattern_matrix, cand_idx, possible_idx, bound
+            )
+            return int(pos), float(score)
+        scores, largest = _expected_remaining(
+            self.pattern_matrix, cand_idx, possible_idx
+        )
+        # lexsort is stable, so full ties keep the earliest candidate.
+        pos = int(np.lexsort((largest, scores))[0])
+        if scores[pos] < bound:
+            return pos, float(scores[pos])
+        return -1, bound
 
     def _show_spinner(self):
-        """Show a loading spinner while computing."""
+        """Show a loading spinner whenever a computation is in progress."""
         spinner_chars = "|/-\\"
-        i = 0
-        while self._spinner_active:
-            print(
-                f"\rComputing optimal guess... {spinner_chars[i % len(spinner_chars)]}",
-                end="",
-                flush=True,
+        while True:
+            self._spinner_active.wait()
+            self._spinner_idle.clear()
+            i = 0
+            while self._spinner_active.is_set():
+                print(
+                    f"\rComputing optimal guess... {spinner_chars[i % len(spinner_chars)]}",
+                    end="",
+                    flush=True,
+                )
+                time.sleep(0.1)
+                i += 1
+            if i:
+                print("\r" + " " * 30 + "\r", end="", flush=True)
+            self._spinner_idle.set()
+
+    def _start_spinner(self):
+        """Start the spinner, reusing one background thread across calls."""
+        if self._spinner_thread is None:
+            self._spinner_thread = threading.Thread(
+                target=self._show_spinner, daemon=True
             )
-            time.sleep(0.1)
-            i += 1
-        print("\r" + " " * 30 + "\r", end="", flush=True)
+            self._spinner_thread.start()
+        self._spinner_active.set()
+
+    def _stop_spinner(self):
+        """Stop the spinner and wait for it to clear its line."""
+        self._spinner_active.clear()
+        self._spinner_idle.wait(timeout=0.2)
 
     def _choose_optimal_guess(
         self,
-        possible_words: Set[str],
-        valid_guesses: Set[str],
+        possible_idx: np.ndarray,
         show_spinner: bool = True,
     ) -> str:
         """
         Choose the optimal guess using information theory.
         Prioritizes guesses that minimize expected remaining words.
         """
-        if len(possible_words) == 1:
-            return list(possible_words)[0]
-
+        # With one or two words left, guessing a possible word is optimal
+        # (it scores 1.0), so skip the scoring and the spinner.
+        if len(possible_idx) <= 2:
+            return self.la_words[possible_idx[0]]
+
+        # Nested calls leave the spinner to the outermost one.
+        show_spinner = (
+            show_spinner and sys.stdout.isatty() and not self._spinner_active.is_set()
+        )
         if show_spinner:
-            self._spinner_active = True
-            self._spinner_thread = threading.Thread(
-                target=self._show_spinner, daemon=True
-            )
-            self._spinner_thread.start()
+            self._start_spinner()
 
         try:
-            if len(possible_words) <= 2:
-                candidates = list(possible_words)
-            else:
-                candidates = list(possible_words) + list(valid_guesses)
-                seen = set()
-                candidates = [w for w in candidates if not (w in seen or seen.add(w))]
-
-            best_guess = None
-            best_score = float("inf")
-
-            for guess in candidates:
-                expected_remaining = self._calculate_expected_remaining(
-                    guess, possible_words
-                )
-                bonus = 0 if guess in possible_words else 0.5
-                score = expected_remaining + bonus
-
-                if score < best_score:
-                    best_score = score
-                    best_guess = guess
+            ordered = self._order_candidates(possible_idx, possible_idx)
+            best, score = self._best_candidate(ordered, possible_idx, np.inf)
+            # Any guess leaves at least 1 word expected, so an exploratory
+            # guess (+0.5) can never beat a possible word scoring <= 1.5.
+            if score <= 1.5:
+                return self.la_words[ordered[best]]
+
+            is_possible = np.zeros(len(self.all_words), dtype=bool)
+            is_possible[possible_idx] = True
+            explore_idx = self._order_candidates(
+                self._all_guess_idx[~is_possible], possible_idx
+            )
 
-            return best_guess or candidates[0]
+            best_explore, _ = self._best_candidate(
+                explore_idx, possible_idx, score - 0.5
+            )
+            if best_explore >= 0:
+                return self.all_words[explore_idx[best_explore]]
+            return self.la_words[ordered[best]]
         finally:
             if show_spinner:
-                self._spinner_active = False
-                if self._spinner_thread:
-                    self._spinner_thread.join(timeout=0.2)
+                self._stop_spinner()
 
-    def solve(self, target: Optional[str] = None, verbose: bool = False) -> int:
+    def _first_guess(self, show_spinner: bool = True) -> str:
+        """
+        The opening guess against the full answer list. It is computed once
+        per process and also cached on disk next to the pattern matrix.
+        """
+        if WordleBot._FIRST_GUESS is None:
+            path = os.path.join(
+                _CACHE_DIR, f"first_guess_v{_SCORING_VERSION}_{self._cache_key}.txt"
+            )
+            try:
+                with open(path) as f:
+                    guess = f.read().strip()
+            except OSError:
+                guess = ""
+            if guess not in self._guess_index:
+                guess = self._choose_optimal_guess(self.la_idx, show_spinner)
+                _save_cache_file(path, lambda f: f.write(guess.encode("ascii")))
+            WordleBot._FIRST_GUESS = guess
+        return WordleBot._FIRST_GUESS
+
+    def _next_guess(
+        self,
+        history: Tuple[FeedbackCode, ...],
+        possible_idx: np.ndarray,
+        show_spinner: bool = True,
+    ) -> str:
+        """
+        Choose the next guess given the feedback to the bot's own guesses so
+        far. Openings depend only on that history, so they are computed once
+        and reused across games.
+        """
+        if not history:
+            return self._first_guess(show_spinner)
+        if len(history) > _OPENING_DEPTH:
+            return self._choose_optimal_guess(possible_idx, show_spinner)
+        guess = self._opening_guesses.get(history)
+        if guess is None:
+            guess = self._choose_optimal_guess(possible_idx, show_spinner)
+            self._opening_guesses[history] = guess
+        return guess
+
+    def solve(
+        self,
+        target: Optional[str] = None,
+        verbose: bool = False,
+        show_spinner: bool = True,
+    ) -> int:
         """
         Solve a Wordle puzzle optimally.
 
         Args:
             target: The target word (if None, randomly selected)
             verbose: If True, print each guess and feedback
+            show_spinner: If True, show a spinner while choosing guesses
 
         Returns:
             Number of guesses taken
@@ -206,14 +501,15 @@ class WordleBot:
         else:
             target = target.upper()
 
-        possible_words = set(self.la_words)
-        valid_guesses = set(self.all_words)
+        possible_idx = self.la_idx
         guesses = []
+        history: Tuple[FeedbackCode, ...] = ()
 
         while True:
-            guess = self._choose_optimal_guess(possible_words, valid_guesses)
+            guess = self._next_guess(history, possible_idx, show_spinner)
             guesses.append(guess)
-            feedback = self._get_feedback(guess, target)
+            code = compute_feedback(guess, target)
+            history += (code,)
 
             if verbose:
                 feedback_str = "".join(
@@ -223,7 +519,7 @@ class WordleBot:
                             if c == Color.GREEN
                             else "🟨" if c == Color.YELLOW else "⬛"
                         )
-                        for _, c in feedback
+                        for _, c in self._get_feedback(guess, target)
                     ]
                 )
                 print(f"Guess {len(guesses)}: {guess} {feedback_str}")
@@ -231,9 +527,9 @@ class WordleBot:
             if guess == target:
                 return len(guesses)
 
-            possible_words = self._filter_words(possible_words, guess, feedback)
+            possible_idx = self._filter_words(possible_idx, guess, code)
 
-            if not possible_words:
+            if not len(possible_idx):
                 if verbose:
                     print(f"Error: No possible words remaining after guess {guess}")
                 return len(guesses)
@@ -253,13 +549,12 @@ class WordleBot:
 
             target = random.choice(self.la_words).upper()
 
-        game = WordleGame()
-        game.target = target.upper()
-        possible_words = set(self.la_words)
-        valid_guesses = set(game.valid_guesses)
+        game = WordleGame.for_target(target)
+        possible_idx = self.la_idx
+        history: Tuple[FeedbackCode, ...] = ()
 
         while not game.is_game_over():
-            guess = self._choose_optimal_guess(possible_words, valid_guesses)
+            guess = self._next_guess(history, possible_idx)
 
             if not game.make_guess(guess):
                 print(f"Error: Invalid guess {guess}")
@@ -270,9 +565,11 @@ class WordleBot:
             if game.is_won():
                 return (game.attempts, True)
 
-            possible_words = self._filter_words(possible_words, guess, feedback)
+            code = self._feedback_to_code(feedback)
+            history += (code,)
+            possible_idx = self._filter_words(possible_idx, guess, code)
 
-            if not possible_words:
+            if not len(possible_idx):
                 break
 
         return (game.attempts, game.is_won())
@@ -291,14 +588,16 @@ class WordleBot:
         Returns:
             Number of guesses taken (including previous guesses)
         """
-        possible_words = set(self.la_words)
-        valid_guesses = set(self.all_words)
+        possible_idx = self.la_idx
         guesses = []
 
         print("Continuing from previous guesses...\n")
 
         for guess, feedback_str in previous_guesses:
             guess = guess.upper()
+            if len(guess) != 5 or not (guess.isascii() and guess.isalpha()):
+                print(f"Invalid guess: {guess}")
+                continue
             if len(feedback_str) != 5 or not all(
                 c in "GYX" for c in feedback_str.upper()
             ):
@@ -306,39 +605,32 @@ class WordleBot:
                 continue
 
             guesses.append(guess)
-
-            feedback = []
-            for i, char in enumerate(feedback_str.upper()):
-                if char == "G":
-                    feedback.append((guess[i], Color.GREEN))
-                elif char == "Y":
-                    feedback.append((guess[i], Color.YELLOW))
-                else:
-                    feedback.append((guess[i], Color.GRAY))
+            code = self._parse_feedback(feedback_str.upper())
 
             if verbose:
                 print(f"Previous guess {len(guesses)}: {guess} {feedback_str.upper()}")
 
-            if all(c == Color.GREEN for _, c in feedback):
+            if code == ALL_GREEN:
                 print(f"\nAlready solved in {len(guesses)} guesses!")
                 return len(guesses)
 
-            possible_words = self._filter_words(possible_words, guess, feedback)
+            possible_idx = self._filter_words(possible_idx, guess, code)
 
-            if not possible_words:
+            if not len(possible_idx):
                 print(f"Error: No possible words remaining after guess {guess}")
                 return len(guesses)
 
             if verbose:
-                print(f"Remaining possibilities: {len(possible_words)}")
-                if len(possible_words) <= 10:
-                    print(f"Possible words: {', '.join(sorted(possible_words))}")
+                print(f"Remaining possibilities: {len(possible_idx)}")
+                if len(possible_idx) <= 10:
+                    words = sorted(self._words(possible_idx))
+                    print(f"Possible words: {', '.join(words)}")
                 print()
 
         print("Continuing to solve...\n")
 
         while True:
-            guess = self._choose_optimal_guess(possible_words, valid_guesses)
+            guess = self._choose_optimal_guess(possible_idx)
             guesses.append(guess)
 
             print(f"Guess {len(guesses)}: {guess}")
@@ -351,29 +643,23 @@ class WordleBot:
                     "Invalid input. Enter 5 characters: G (green), Y (yellow), X (gray)"
                 )
 
-            feedback = []
-            for i, char in enumerate(feedback_input):
-                if char == "G":
-                    feedback.append((guess[i], Color.GREEN))
-                elif char == "Y":
-                    feedback.append((guess[i], Color.YELLOW))
-                else:
-                    feedback.append((guess[i], Color.GRAY))
+            code = self._parse_feedback(feedback_input)
 
-            if all(c == Color.GREEN for _, c in feedback):
+            if code == ALL_GREEN:
                 print(f"\nSolved in {len(guesses)} guesses!")
                 return len(guesses)
 
-            possible_words = self._filter_words(possible_words, guess, feedback)
+            possible_idx = self._filter_words(possible_idx, guess, code)
 
-            if not possible_words:
+            if not len(possible_idx):
                 print(f"Error: No possible words remaining after guess {guess}")
                 return len(guesses)
 
             if verbose:
-                print(f"Remaining possibilities: {len(possible_words)}")
-                if len(possible_words) <= 10:
-                    print(f"Possible words: {', '.join(sorted(possible_words))}")
+                print(f"Remaining possibilities: {len(possible_idx)}")
+                if len(possible_idx) <= 10:
+                    words = sorted(self._words(possible_idx))
+                    print(f"Possible words: {', '.join(words)}")
             print()
 
     def solve_interactive(self, verbose: bool = True) -> int:
@@ -386,16 +672,16 @@ class WordleBot:
         Returns:
             Number of guesses taken
         """
-        possible_words = set(self.la_words)
-        valid_guesses = set(self.all_words)
+        possible_idx = self.la_idx
         guesses = []
+        history: Tuple[FeedbackCode, ...] = ()
 
         print("Interactive Wordle Solver")
         print("Enter feedback as 5 characters: G (green), Y (yellow), X (gray)")
         print("Example: GYXXG means first letter green, second yellow, rest gray\n")
 
         while True:
-            guess = self._choose_optimal_guess(possible_words, valid_guesses)
+            guess = self._next_guess(history, possible_idx)
             guesses.append(guess)
 
             print(f"Guess {len(guesses)}: {guess}")
@@ -408,29 +694,24 @@ class WordleBot:
                     "Invalid input. Enter 5 characters: G (green), Y (yellow), X (gray)"
                 )
 
-            feedback = []
-            for i, char in enumerate(feedback_input):
-                if char == "G":
-                    feedback.append((guess[i], Color.GREEN))
-                elif char == "Y":
-                    feedback.append((guess[i], Color.YELLOW))
-                else:
-                    feedback.append((guess[i], Color.GRAY))
+            code = self._parse_feedback(feedback_input)
 
-            if all(c == Color.GREEN for _, c in feedback):
+            if code == ALL_GREEN:
                 print(f"\nSolved in {len(guesses)} guesses!")
                 return len(guesses)
 
-            possible_words = self._filter_words(possible_words, guess, feedback)
+            history += (code,)
+            possible_idx = self._filter_words(possible_idx, guess, code)
 
-            if not possible_words:
+            if not len(possible_idx):
                 print(f"Error: No possible words remaining after guess {guess}")
                 return len(guesses)
 
             if verbose:
-                print(f"Remaining possibilities: {len(possible_words)}")
-                if len(possible_words) <= 10:
-                    print(f"Possible words: {', '.join(sorted(possible_words))}")
+                print(f"Remaining possibilities: {len(possible_idx)}")
+                if len(possible_idx) <= 10:
+                    words = sorted(self._words(possible_idx))
+                    print(f"Possible words: {', '.join(words)}")
             print()
 
     def solve_with_game(self, game: WordleGame, verbose: bool = True) -> int:
@@ -444,12 +725,12 @@ class WordleBot:
         Returns:
             Number of guesses taken
         """
-        possible_words = set(self.la_words)
-        valid_guesses = set(game.valid_guesses)
+        possible_idx = self.la_idx
         guesses = []
+        history: Tuple[FeedbackCode, ...] = ()
 
         while not game.is_game_over():
-            guess = self._choose_optimal_guess(possible_words, valid_guesses)
+            guess = self._next_guess(history, possible_idx)
             guesses.append(guess)
 
             if not game.make_guess(guess):
@@ -473,19 +754,49 @@ class WordleBot:
                     print(f"\nSolved in {len(guesses)} guesses!")
                 return len(guesses)
 
-            possible_words = self._filter_words(possible_words, guess, feedback)
+            code = self._feedback_to_code(feedback)
+            history += (code,)
+            possible_idx = self._filter_words(possible_idx, guess, code)
 
-            if not possible_words:
+            if not len(possible_idx):
                 if verbose:
                     print(f"Error: No possible words remaining after guess {guess}")
                 break
 
-            if verbose and len(possible_words) <= 10:
-                print(f"Remaining: {len(possible_words)} words")
+            if verbose and len(possible_idx) <= 10:
+                print(f"Remaining: {len(possible_idx)} words")
 
         return len(guesses)
 
 
+_worker_bot: Optional[WordleBot] = None
+
+
+def _init_worker():
+    """Create the bot for a worker process of a multi-game run."""
+    global _worker_bot
+    if _feedback_jit is not None:
+        from numba import set_num_threads
+
+        # Parallelism comes from the processes; don't oversubscribe cores.
+        set_num_threads(1)
+    # The pattern matrix is memory-mapped from the cache file the parent
+    # wrote, so workers share its physical pages.
+    _worker_bot = WordleBot()
+
+
+def _solve_one(target: str, verbose: bool = False) -> Tuple[int, str]:
+    """
+    Solve one game in a worker process.
+    Returns (guesses, the game's output), so the parent can print each game's
+    log in one piece instead of interleaving lines from concurrent games.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        guesses = _worker_bot.solve(target, verbose=verbose, show_spinner=False)
+    return guesses, output.getvalue()
+
+
 def main():
     """Main entry point for the bot."""
     import argparse
@@ -526,6 +837,13 @@ def main():
         type=str,
         help="Continue from previous guesses. Format: 'GUESS1:FEEDBACK1,GUESS2:FEEDBACK2' (e.g., 'ROATE:XYGXY,CRANE:GGGXX')",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for multi-game runs (default: CPU count)",
+    )
     args = parser.parse_args()
 
     bot = WordleBot()
@@ -551,12 +869,22 @@ def main():
         print(f"\nTarget was: {game.target}")
         print(f"Solved in {guesses} guesses!")
     elif args.stats or args.games > 1:
+        import random
+
+        targets = [random.choice(bot.la_words) for _ in range(args.games)]
+        jobs = max(1, min(args.jobs, args.games))
         results = []
-        for i in range(args.games):
-            guesses = bot.solve(verbose=args.verbose)
-            results.append(guesses)
-            if args.verbose:
-                print(f"Game {i + 1}: {guesses} guesses\n")
+        # Forking after a Numba parallel kernel has run (as when the parent
+        # just built the pattern matrix) can hang the parent at exit, so
+        # start clean workers; they memory-map the cached matrix.
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(jobs, initializer=_init_worker) as pool:
+            solve_one = functools.partial(_solve_one, verbose=args.verbose)
+            for i, (guesses, output) in enumerate(pool.imap(solve_one, targets)):
+                results.append(guesses)
+                if args.verbose:
+                    print(output, end="")
+                    print(f"Game {i + 1}: {guesses} guesses\n")
 
         if args.stats:
             print(f"\nStatistics over {args.games} games:")
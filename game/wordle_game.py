@@ -3,17 +3,19 @@
 WordleGame class and related components for the Wordle game simulator.
 """
 
+import functools
 import random
 import sys
 import os
-from enum import Enum
-from typing import List, Tuple, Dict, Set, Optional
+from enum import IntEnum
+from typing import List, Tuple, Dict, Set, FrozenSet, Optional
 
 
-class Color(Enum):
-    GREEN = "green"
-    YELLOW = "yellow"
-    GRAY = "gray"
+class Color(IntEnum):
+    # Values are the digits of a base-3 feedback pattern code.
+    GREEN = 2
+    YELLOW = 1
+    GRAY = 0
 
 
 class Colors:
@@ -25,15 +27,36 @@ class Colors:
     WHITE = "\033[97m"
 
 
+# ANSI prefixes indexed by Color value.
+_ANSI_COLORS = (Colors.GRAY, Colors.YELLOW, Colors.GREEN)
+_ANSI_BOLD_COLORS = tuple(Colors.BOLD + ansi for ansi in _ANSI_COLORS)
+
+_KEYBOARD_ROWS = ("QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM")
+
 CLEAR_LINE = "\033[2K"
 MOVE_UP = "\033[1A"
 CURSOR_HOME = "\033[0G"
+_CLEAR_AND_UP = CLEAR_LINE + MOVE_UP
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _DICTIONARY_DIR = os.path.join(os.path.dirname(_SCRIPT_DIR), "dictionary")
 WORDLE_LA_FILE = os.path.join(_DICTIONARY_DIR, "wordle-La.txt")
 WORDLE_TA_FILE = os.path.join(_DICTIONARY_DIR, "wordle-Ta.txt")
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_word_lists(
+    la_path: str, ta_path: str
+) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """
+    Load the word lists once per process.
+    Returns (possible answers, all valid guesses); both are immutable, so
+    every game shares them.
+    """
+    la_words = tuple(WordleGame._load_word_list(la_path))
+    ta_words = WordleGame._load_word_list(ta_path)
+    return la_words, frozenset(la_words).union(ta_words)
+
+
 class WordleGame:
     """Encapsulates the state and logic of a Wordle game."""
 
@@ -45,28 +68,60 @@ class WordleGame:
             dictionary_dir: Directory containing word lists. If None, uses default paths.
             hard_mode: If True, requires using all revealed green and yellow letters.
         """
-        la_words = self._load_word_list(WORDLE_LA_FILE)
-        ta_words = self._load_word_list(WORDLE_TA_FILE)
-        self.target = random.choice(la_words).upper()
-        self.valid_guesses: Set[str] = set(la_words + ta_words)
+        la_words, valid_guesses = _cached_word_lists(WORDLE_LA_FILE, WORDLE_TA_FILE)
+        self._start(random.choice(la_words), valid_guesses, hard_mode)
+
+    @classmethod
+    def for_target(
+        cls, target: str, hard_mode: bool = False, validate: bool = False
+    ) -> "WordleGame":
+        """
+        Create a game with a known target word, e.g. for a solver.
+
+        Args:
+            target: The 5-letter word to guess.
+            hard_mode: If True, requires using all revealed green and yellow letters.
+            validate: If True, guesses must be in the dictionary; otherwise the
+                word lists are not loaded and any 5 ASCII letters are accepted.
+        """
+        target = target.upper()
+        if len(target) != 5 or not (target.isascii() and target.isalpha()):
+            raise ValueError(f"Target must be 5 ASCII letters: {target!r}")
+        valid_guesses = None
+        if validate:
+            _, valid_guesses = _cached_word_lists(WORDLE_LA_FILE, WORDLE_TA_FILE)
+        game = cls.__new__(cls)
+        game._start(target, valid_guesses, hard_mode)
+        return game
+
+    def _start(
+        self, target: str, valid_guesses: Optional[FrozenSet[str]], hard_mode: bool
+    ):
+        """Set up the state of a new game. valid_guesses=None accepts any word."""
+        self.target = target
+        self.valid_guesses = valid_guesses
         self.attempts = 0
         self.max_attempts = 6
-        self.guessed_letters: Dict[str, Color] = {}
-        self.all_guesses: List[List[Tuple[str, Color]]] = []
+        # Best color seen per letter A..Z as color + 1; 0 means not guessed.
+        self._keyboard = bytearray(26)
+        # Letters and Color values of every guess so far, five bytes per guess.
+        self._guess_letters = bytearray()
+        self._guess_colors = bytearray()
         self.lines_printed = 0
         self.won = False
         self.hard_mode = hard_mode
         self.required_green_positions: Dict[int, str] = {}
-        self.required_yellow_letters: Set[str] = set()
-        self.yellow_positions: Dict[str, Set[int]] = {}
+        # Hard mode yellows as 26-bit letter masks: letters every guess must
+        # contain, and per position the letters already ruled out there.
+        self._yellow_mask = 0
+        self._yellow_forbidden = [0] * 5
 
     @staticmethod
     def _load_word_list(filename: str) -> List[str]:
         """Load the word list from file."""
         try:
             with open(filename, "r") as f:
-                words = [line.strip().upper() for line in f if line.strip()]
-            return words
+                return f.read().upper().split()
         except FileNotFoundError:
             print(f"Error: {filename} not found!")
             sys.exit(1)
@@ -76,36 +131,91 @@ class WordleGame:
         Generate feedback for a guess.
         Returns a list of tuples: (letter, color)
         """
-        feedback: List[Tuple[str, Optional[Color]]] = []
-        target_list = list(self.target)
-        guess_list = list(guess)
-
-        for i in range(len(guess_list)):
-            if guess_list[i] == target_list[i]:
-                feedback.append((guess_list[i], Color.GREEN))
-                target_list[i] = None
-                guess_list[i] = None
-
-        for i in range(len(guess_list)):
-            if guess_list[i] is not None:
-                if guess_list[i] in target_list:
-                    feedback.append((guess_list[i], Color.YELLOW))
-                    target_list[target_list.index(guess_list[i])] = None
-                else:
-                    feedback.append((guess_list[i], Color.GRAY))
+        green, yellow, gray = Color.GREEN, Color.YELLOW, Color.GRAY
+        g0, g1, g2, g3, g4 = guess
+        t0, t1, t2, t3, t4 = self.target
+        # Unmatched target letters, counted per letter A..Z.
+        remaining = [0] * 26
+        c0 = c1 = c2 = c3 = c4 = None
+
+        if g0 == t0:
+            c0 = green
+        else:
+            remaining[ord(t0) - 65] += 1
+        if g1 == t1:
+            c1 = green
+        else:
+            remaining[ord(t1) - 65] += 1
+        if g2 == t2:
+            c2 = green
+        else:
+            remaining[ord(t2) - 65] += 1
+        if g3 == t3:
+            c3 = green
+        else:
+            remaining[ord(t3) - 65] += 1
+        if g4 == t4:
+            c4 = green
+        else:
+            remaining[ord(t4) - 65] += 1
+
+        if c0 is None:
+            index = ord(g0) - 65
+            if remaining[index]:
+                remaining[index] -= 1
+                c0 = yellow
+            else:
+                c0 = gray
+        if c1 is None:
+            index = ord(g1) - 65
+            if remaining[index]:
+                remaining[index] -= 1
+                c1 = yellow
+            else:
+                c1 = gray
+        if c2 is None:
+            index = ord(g2) - 65
+            if remaining[index]:
+                remaining[index] -= 1
+                c2 = yellow
+            else:
+                c2 = gray
+        if c3 is None:
+            index = ord(g3) - 65
+            if remaining[index]:
+                remaining[index] -= 1
+                c3 = yellow
+            else:
+                c3 = gray
+        if c4 is None:
+            index = ord(g4) - 65
+            if remaining[index]:
+                remaining[index] -= 1
+                c4 = yellow
+            else:
+                c4 = gray
+
+        return [(g0, c0), (g1, c1), (g2, c2), (g3, c3), (g4, c4)]
 
-        return feedback  # type: ignore[return-value]
+    @staticmethod
+    def _normalize_guess(guess: str) -> str:
+        """Upper-case an ASCII guess; anything else becomes "" and is invalid."""
+        return guess.upper() if guess.isascii() else ""
 
     def is_valid_guess(self, guess: str) -> bool:
         """Check if the guess is valid (5 letters and in valid guesses set)."""
+        return self._is_valid_normalized(self._normalize_guess(guess))
+
+    def _is_valid_normalized(self, guess: str) -> bool:
+        """is_valid_guess for a guess already passed through _normalize_guess."""
         if len(guess) != 5:
             return False
         if not guess.isalpha():
             return False
-        if guess.upper() not in self.valid_guesses:
+        if self.valid_guesses is not None and guess not in self.valid_guesses:
             return False
         if self.hard_mode:
-            return self._is_valid_hard_mode(guess.upper())
+            return self._is_valid_hard_mode(guess)
         return True
 
     def _is_valid_hard_mode(self, guess: str) -> bool:
@@ -114,14 +224,13 @@ class WordleGame:
             if guess[position] != required_letter:
                 return False
 
-        for required_letter in self.required_yellow_letters:
-            if required_letter not in guess:
+        letters = 0
+        for position, letter in enumerate(guess):
+            bit = 1 << (ord(letter) - 65)
+            if bit & self._yellow_forbidden[position]:
                 return False
-            if required_letter in self.yellow_positions:
-                for position in self.yellow_positions[required_letter]:
-                    if guess[position] == required_letter:
-                        return False
-        return True
+            letters |= bit
+        return letters & self._yellow_mask == self._yellow_mask
 
     def _get_hard_mode_error(self, guess: str) -> str:
         """Get error message for hard mode validation failure."""
@@ -132,11 +241,12 @@ class WordleGame:
                     f"Position {position + 1} must be '{required_letter}' (green)"
                 )
 
-        for required_letter in self.required_yellow_letters:
+        yellow_positions = self.yellow_positions
+        for required_letter in sorted(self.required_yellow_letters):
             if required_letter not in guess:
                 errors.append(f"Must include '{required_letter}' (yellow)")
-            elif required_letter in self.yellow_positions:
-                for position in self.yellow_positions[required_letter]:
+            elif required_letter in yellow_positions:
+                for position in sorted(yellow_positions[required_letter]):
                     if guess[position] == required_letter:
                         errors.append(
                             f"'{required_letter}' cannot be in position {position + 1} (was yellow there)"
@@ -146,98 +256,123 @@ class WordleGame:
             return "Hard mode violation: " + "; ".join(errors)
         return ""
 
+    @property
+    def all_guesses(self) -> List[List[Tuple[str, Color]]]:
+        """Feedback for every guess so far as lists of (letter, color)."""
+        letters = self._guess_letters.decode("ascii")
+        return [
+            [
+                (letters[i], Color(self._guess_colors[i]))
+                for i in range(start, start + 5)
+            ]
+            for start in range(0, len(letters), 5)
+        ]
+
+    @property
+    def required_yellow_letters(self) -> Set[str]:
+        """Letters revealed yellow that every hard mode guess must contain."""
+        return {chr(65 + i) for i in range(26) if self._yellow_mask >> i & 1}
+
+    @property
+    def yellow_positions(self) -> Dict[str, Set[int]]:
+        """Positions where each yellow letter has already been ruled out."""
+        positions: Dict[str, Set[int]] = {}
+        for position, mask in enumerate(self._yellow_forbidden):
+            for i in range(26):
+                if mask >> i & 1:
+                    positions.setdefault(chr(65 + i), set()).add(position)
+        return positions
+
+    @property
+    def guessed_letters(self) -> Dict[str, Color]:
+        """Best color revealed so far for each guessed letter."""
+        return {
+            chr(65 + i): Color(rank - 1)
+            for i, rank in enumerate(self._keyboard)
+            if rank
+        }
+
     def _update_keyboard_state(self, feedback: List[Tuple[str, Color]]):
         """Update the keyboard state based on feedback."""
         for i, (letter, color) in enumerate(feedback):
             letter_upper = letter.upper()
-            if letter_upper not in self.guessed_letters or color == Color.GREEN:
-                self.guessed_letters[letter_upper] = color
+            index = ord(letter_upper) - 65
+            if color >= self._keyboard[index]:
+                self._keyboard[index] = color + 1
 
             if self.hard_mode:
                 if color == Color.GREEN:
                     self.required_green_positions[i] = letter_upper
                 elif color == Color.YELLOW:
-                    self.required_yellow_letters.add(letter_upper)
-                    if letter_upper not in self.yellow_positions:
-                        self.yellow_positions[letter_upper] = set()
-                    self.yellow_positions[letter_upper].add(i)
+                    self._yellow_mask |= 1 << index
+                    self._yellow_forbidden[i] |= 1 << index
 
     @staticmethod
     def _get_ansi_color(color: Color, bold: bool = False) -> str:
         """Get ANSI color code for a Color enum value."""
-        color_map = {
-            Color.GREEN: Colors.GREEN,
-            Color.YELLOW: Colors.YELLOW,
-            Color.GRAY: Colors.GRAY,
-        }
-        ansi_color = color_map[color]
-        return f"{Colors.BOLD}{ansi_color}" if bold else ansi_color
+        return (_ANSI_BOLD_COLORS if bold else _ANSI_COLORS)[color]
 
-    def _display_header(self) -> int:
-        """Display the game header. Returns number of lines printed."""
+    def _display_header(self, out: List[str]) -> int:
+        """Render the game header into out. Returns number of lines printed."""
         mode_text = "HARD MODE" if self.hard_mode else "NORMAL MODE"
-        print(f"{Colors.BOLD}=== WORDLE ({mode_text}) ==={Colors.RESET}")
-        print("Guess the 5-letter word in 6 attempts!")
-        print("Green = correct letter, correct position")
-        print("Yellow = correct letter, wrong position")
-        print("Gray = letter not in word")
+        out.append(f"{Colors.BOLD}=== WORDLE ({mode_text}) ==={Colors.RESET}\n")
+        out.append("Guess the 5-letter word in 6 attempts!\n")
+        out.append("Green = correct letter, correct position\n")
+        out.append("Yellow = correct letter, wrong position\n")
+        out.append("Gray = letter not in word\n")
         if self.hard_mode:
-            print("Hard mode: Must use all revealed green and yellow letters!")
-        print()
+            out.append("Hard mode: Must use all revealed green and yellow letters!\n")
+        out.append("\n")
         return 7 if self.hard_mode else 6
 
-    def _display_guesses(self) -> int:
-        """Display all previous guesses. Returns number of lines printed."""
+    def _display_guesses(self, out: List[str]) -> int:
+        """Render all previous guesses into out. Returns number of lines printed."""
         lines = 0
-        for feedback in self.all_guesses:
-            for letter, color in feedback:
+        letters = self._guess_letters.decode("ascii")
+        for start in range(0, len(letters), 5):
+            row = zip(letters[start : start + 5], self._guess_colors[start : start + 5])
+            for letter, color in row:
                 ansi_color = self._get_ansi_color(color, bold=True)
-                print(f"{ansi_color}{letter}{Colors.RESET}", end=" ")
-            print()
+                out.append(f"{ansi_color}{letter}{Colors.RESET} ")
+            out.append("\n")
             lines += 1
         return lines
 
-    def _display_keyboard(self) -> int:
-        """Display the keyboard state. Returns number of lines printed."""
-        keyboard_rows = [
-            ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
-            ["A", "S", "D", "F", "G", "H", "J", "K", "L"],
-            ["Z", "X", "C", "V", "B", "N", "M"],
-        ]
-
-        print("\nKeyboard:")
+    def _display_keyboard(self, out: List[str]) -> int:
+        """Render the keyboard state into out. Returns number of lines printed."""
+        out.append("\nKeyboard:\n")
         lines = 1
-        for row in keyboard_rows:
+        for row in _KEYBOARD_ROWS:
             for letter in row:
-                if letter in self.guessed_letters:
-                    color = self.guessed_letters[letter]
-                    ansi_color = self._get_ansi_color(color)
-                    print(f"{ansi_color}{letter}{Colors.RESET}", end=" ")
+                rank = self._keyboard[ord(letter) - 65]
+                if rank:
+                    ansi_color = self._get_ansi_color(Color(rank - 1))
+                    out.append(f"{ansi_color}{letter}{Colors.RESET} ")
                 else:
-                    print(f"{Colors.WHITE}{letter}{Colors.RESET}", end=" ")
-            print()
+                    out.append(f"{Colors.WHITE}{letter}{Colors.RESET} ")
+            out.append("\n")
             lines += 1
         return lines
 
-    def _clear_display(self):
-        """Clear previous display by moving up and clearing lines."""
-        if self.lines_printed > 0:
-            for _ in range(self.lines_printed):
-                print(f"{CLEAR_LINE}{MOVE_UP}", end="")
-        print(f"{CURSOR_HOME}", end="")
+    def _clear_display(self, out: List[str]):
+        """Render the escapes that clear the previous display into out."""
+        out.append(_CLEAR_AND_UP * self.lines_printed + CURSOR_HOME)
 
     def display_game_state(self):
         """
         Display the entire game state: all previous guesses and keyboard.
         This function overwrites previous output.
         """
-        self._clear_display()
+        # Build the whole frame and write it at once rather than print by print.
+        out: List[str] = []
+        self._clear_display(out)
 
         lines = 0
-        lines += self._display_header()
-        lines += self._display_guesses()
-        lines += self._display_keyboard()
+        lines += self._display_header(out)
+        lines += self._display_guesses(out)
+        lines += self._display_keyboard(out)
 
+        sys.stdout.write("".join(out))
         sys.stdout.flush()
         self.lines_printed = lines
 
@@ -251,13 +386,14 @@ class WordleGame:
         Returns:
             True if the guess was valid, False otherwise
         """
-        guess = guess.strip().upper()
+        guess = self._normalize_guess(guess.strip())
 
-        if not self.is_valid_guess(guess):
+        if not self._is_valid_normalized(guess):
             return False
 
         feedback = self._get_feedback(guess)
-        self.all_guesses.append(feedback)
+        self._guess_letters += guess.encode("ascii")
+        self._guess_colors.extend(color for _, color in feedback)
         self._update_keyboard_state(feedback)
 
         if guess == self.target:
@@ -280,18 +416,17 @@ class WordleGame:
 
         while not self.is_game_over():
             print(f"\nAttempt {self.attempts + 1}/{self.max_attempts}")
-            guess = input("Enter your guess: ").strip().upper()
+            guess = self._normalize_guess(input("Enter your guess: ").strip())
 
             if not self.make_guess(guess):
                 print(f"{CLEAR_LINE}{MOVE_UP}{CLEAR_LINE}{MOVE_UP}{CLEAR_LINE}", end="")
-                guess_upper = guess.strip().upper()
                 if (
                     self.hard_mode
-                    and len(guess_upper) == 5
-                    and guess_upper.isalpha()
-                    and guess_upper in self.valid_guesses
+                    and len(guess) == 5
+                    and guess.isalpha()
+                    and (self.valid_guesses is None or guess in self.valid_guesses)
                 ):
-                    error_msg = self._get_hard_mode_error(guess_upper)
+                    error_msg = self._get_hard_mode_error(guess)
                     if error_msg:
                         print(error_msg)
                     else: